@@ -23,14 +23,23 @@ class ConnectionConfig(BaseModel):
     Args:
         pool_size (int): Number of connections to maintain in the connection pool.
             Establishing connections is expensive and maintaining multiple connections
-            in a pool allows for availability.
+            in a pool allows for availability. If unset, the sqlalchemy default for
+            the dialect's pool is used.
+        max_overflow (int): Number of connections that may be opened beyond
+            pool_size under load. Overflow connections are closed when returned to
+            the pool. If unset, the sqlalchemy default for the dialect's pool is
+            used.
         pool_pre_ping (bool): Performs liveliness check and expires all existing
             connections if the database is unreachable.
+        pool_recycle (int): Number of seconds after which a pooled connection is
+            replaced, avoiding connections dropped by the server on idle timeout.
 
     """
 
     pool_size: Optional[int]
+    max_overflow: Optional[int]
     pool_pre_ping: bool = True
+    pool_recycle: Optional[int] = 300
 
 
 class ModelDBConfig(BaseModel):
@@ -172,11 +181,12 @@ class ModelDB:
 
         return res
 
-    def select(self, sql: Select) -> list:
+    def select(self, sql: Select, params: Optional[dict] = None) -> list:
         """Execute sql query inside a managed session.
 
         Args:
             sql (Select): Selection query to execute.
+            params (Optional[dict]): Values for bound parameters in the query.
 
         Results:
             list: Results of selection operation
@@ -185,7 +195,7 @@ class ModelDB:
         logger.info("ModelDB selecting: %s", str(sql))
         with self.session() as session:
 
-            res = session.execute(sql).scalars().all()
+            res = session.execute(sql, params).scalars().all()
             session.commit()
 
         return res
@@ -210,6 +220,37 @@ class ModelDB:
 
         return res.inserted_primary_key
 
+    def insert_scalar(self, sql: Insert) -> Optional[Union[str, int]]:
+        """Execute an insert operation on a core connection and return the single
+        primary key of the inserted row. Skips orm session handling for inserts that
+        only need the key back.
+
+        Args:
+            sql (Insert): Sqlalchemy insert operation. If the statement has a
+                returning clause, the first returned column is used.
+
+        Returns:
+            Optional[Union[str, int]]: primary key returned from insert operation
+
+        """
+        logger.info("ModelDB inserting: %s", str(sql))
+        with self.connection() as cxn:
+            with cxn.begin():
+                res = cxn.execute(sql)
+
+                if res.returns_rows:
+                    primary_key = res.scalar()
+
+                else:
+                    inserted_primary_key = res.inserted_primary_key
+                    primary_key = (
+                        inserted_primary_key[0] if inserted_primary_key else None
+                    )
+
+        logger.info("Sucessfully executed: %s", str(sql))
+
+        return primary_key
+
     def insert_many(self, sql: List[Insert]) -> List[Union[str, int]]:
         """Execute many inserts within a managed session.
 
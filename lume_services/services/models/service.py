@@ -1,5 +1,8 @@
-from typing import List
-from sqlalchemy import insert, select, desc
+from functools import lru_cache
+from typing import FrozenSet, List, Optional, Set, Tuple
+from sqlalchemy import insert, select, desc, bindparam
+from sqlalchemy.sql.expression import Select
+from sqlalchemy.orm import joinedload
 import logging
 
 from lume_services.services.models.db import ModelDB
@@ -24,12 +27,108 @@ from lume_services.errors import (
 
 logger = logging.getLogger(__name__)
 
+# engine urls with schema already applied in this process
+_SCHEMA_APPLIED: Set[str] = set()
+
+
+@lru_cache(maxsize=128)
+def _compiled_select(
+    table,
+    keys: Tuple[str, ...],
+    null_keys: FrozenSet[str] = frozenset(),
+    limit: Optional[int] = None,
+    order_by_desc: Optional[str] = None,
+    joined: Optional[str] = None,
+) -> Select:
+    """Build a selection query on a table with a bound parameter for each key.
+    Statements are cached by table, key signature, and query options, so repeated
+    lookups of the same shape reuse one statement. Values are passed at execution.
+
+    Args:
+        table: Schema table to select from
+        keys (Tuple[str, ...]): Sorted names of columns to filter on
+        null_keys (FrozenSet[str]): Keys matched with IS NULL rather than a bound
+            parameter
+        limit (Optional[int]): Maximum number of rows to return
+        order_by_desc (Optional[str]): Name of column to order by, descending
+        joined (Optional[str]): Name of relationship to eager load with a join
+
+    Returns:
+        Select
+    """
+    criteria = [
+        getattr(table, key).is_(None)
+        if key in null_keys
+        else getattr(table, key) == bindparam(key)
+        for key in keys
+    ]
+    query = select(table).where(*criteria)
+
+    if order_by_desc is not None:
+        query = query.order_by(desc(getattr(table, order_by_desc)))
+
+    if limit is not None:
+        query = query.limit(limit)
+
+    if joined is not None:
+        query = query.options(joinedload(getattr(table, joined)))
+
+    return query
+
+
+def _select_query(table, kwargs: dict, **options) -> Tuple[Select, dict]:
+    """Get the cached selection query for the shape of kwargs along with the
+    parameters to execute it with. None values are matched with IS NULL, as with
+    filter_by.
+
+    Args:
+        table: Schema table to select from
+        kwargs (dict): Column values to filter on
+        **options: Query options passed to _compiled_select
+
+    Returns:
+        Tuple[Select, dict]: Query and parameters for execution
+    """
+    null_keys = frozenset(key for key, value in kwargs.items() if value is None)
+    query = _compiled_select(table, tuple(sorted(kwargs)), null_keys, **options)
+    params = {key: value for key, value in kwargs.items() if value is not None}
+
+    return query, params
+
 
 class ModelDBService:
+    """Service for storing and querying models, deployments, projects, and flows in
+    the model database.
+
+    When fetching several rows by primary key, use get_models_by_ids,
+    get_deployments_by_ids, or get_flows_by_ids rather than looping over the
+    single-row getters. These issue one query for the full set of ids, omit ids
+    without a matching row, and do not preserve the order of ids.
+
+    """
+
     def __init__(self, model_db: ModelDB):
         self._model_db = model_db
         self._model_registry = {}
 
+    def _select_by_ids(self, table, column, ids: list) -> list:
+        """Select all rows of a table whose primary key is in ids with a single
+        query. Empty ids return an empty list without querying.
+
+        Args:
+            table: Schema table to select from
+            column: Primary key column of the table
+            ids (list): Primary key values to select.
+
+        Returns:
+            list: Rows found, ids without a row are omitted
+        """
+        if not ids:
+            return []
+
+        query = select(table).where(column.in_(ids))
+        return self._model_db.select(query)
+
     @validate_kwargs_exist(Model)
     def store_model(
         self,
@@ -54,13 +153,7 @@ class ModelDBService:
             description=description,
         )
 
-        result = self._model_db.insert(insert_stmt)
-
-        if len(result):
-            return result[0]
-
-        else:
-            return None
+        return self._model_db.insert_scalar(insert_stmt)
 
     def store_deployment(
         self,
@@ -101,13 +194,7 @@ class ModelDBService:
             package_import_name=package_import_name,
         )
 
-        result = self._model_db.insert(insert_stmt)
-
-        if len(result):
-            return result[0]
-
-        else:
-            return None
+        return self._model_db.insert_scalar(insert_stmt)
 
     def store_project(self, project_name: str, description: str) -> str:
         """Store a project.
@@ -124,15 +211,8 @@ class ModelDBService:
             project_name=project_name, description=description
         )
 
-        # store in db
-        result = self._model_db.insert(insert_stmt)
-
-        # Return inserted project name
-        if len(result):
-            return result[0]
-
-        else:
-            return None
+        # store in db and return inserted project name
+        return self._model_db.insert_scalar(insert_stmt)
 
     def store_flow(
         self, deployment_id: int, flow_id: str, flow_name: str, project_name: str
@@ -156,14 +236,8 @@ class ModelDBService:
             project_name=project_name,
         )
 
-        results = self._model_db.insert(insert_stmt)
-
-        # flow_id is result of first insert
-        if len(results):
-            return results[0]
-
-        else:
-            return None
+        # flow_id is primary key of insert
+        return self._model_db.insert_scalar(insert_stmt)
 
     @validate_kwargs_exist(Model)
     def get_model(self, **kwargs) -> Model:
@@ -172,12 +246,12 @@ class ModelDBService:
         Returns:
             Model
         """
-        # execute query
-        query = select(Model).filter_by(**kwargs)
+        # execute query, a second row is only needed to detect duplicates
+        query, params = _select_query(Model, kwargs, limit=2)
 
-        result = self._model_db.select(query)
+        result = self._model_db.select(query, params)
 
-        if len(result):
+        if result:
             if len(result) > 1:
                 # formatted this way to eventually move towards interpolated schema
                 logger.warning(
@@ -192,6 +266,18 @@ class ModelDBService:
         else:
             raise ModelNotFoundError(query)
 
+    def get_models_by_ids(self, ids: List[int]) -> List[Model]:
+        """Get a set of models by model id using a single query. Ids without a
+        matching model are omitted, and rows are not returned in the order of ids.
+
+        Args:
+            ids (List[int]): Model ids to select.
+
+        Returns:
+            List[Model]
+        """
+        return self._select_by_ids(Model, Model.model_id, ids)
+
     @validate_kwargs_exist(Deployment)
     def get_deployment(self, **kwargs) -> Deployment:
         """Get a deployment based on criteria
@@ -200,10 +286,11 @@ class ModelDBService:
             Deployment
         """
 
-        query = select(Deployment).filter_by(**kwargs)
-        result = self._model_db.select(query)
+        # a second row is only needed to detect duplicates
+        query, params = _select_query(Deployment, kwargs, limit=2)
+        result = self._model_db.select(query, params)
 
-        if len(result):
+        if result:
             if len(result) > 1:
                 # formatted this way to eventually move towards interpolated schema
                 logger.warning(
@@ -218,6 +305,7 @@ class ModelDBService:
         else:
             raise DeploymentNotFoundError(query)
 
+    @validate_kwargs_exist(Deployment)
     def get_deployments(self, **kwargs) -> List[Deployment]:
         """Get a set of deployments based on criteria
 
@@ -225,10 +313,10 @@ class ModelDBService:
             List[Deployment]
         """
 
-        query = select(Deployment).filter_by(**kwargs)
-        result = self._model_db.select(query)
+        query, params = _select_query(Deployment, kwargs)
+        result = self._model_db.select(query, params)
 
-        if len(result):
+        if result:
             return result
 
         else:
@@ -236,6 +324,19 @@ class ModelDBService:
 
         ...
 
+    def get_deployments_by_ids(self, ids: List[int]) -> List[Deployment]:
+        """Get a set of deployments by deployment id using a single query. Ids
+        without a matching deployment are omitted, and rows are not returned in the
+        order of ids.
+
+        Args:
+            ids (List[int]): Deployment ids to select.
+
+        Returns:
+            List[Deployment]
+        """
+        return self._select_by_ids(Deployment, Deployment.deployment_id, ids)
+
     @validate_kwargs_exist(Deployment)
     def get_latest_deployment(self, **kwargs) -> Deployment:
         """Get the latest deployment
@@ -247,14 +348,12 @@ class ModelDBService:
             ValueError: Passed kwarg not in Project schema
         """
 
-        query = (
-            select(Deployment)
-            .filter_by(**kwargs)
-            .order_by(desc(Deployment.deploy_date))
+        query, params = _select_query(
+            Deployment, kwargs, limit=1, order_by_desc="deploy_date"
         )
-        result = self._model_db.select(query)
+        result = self._model_db.select(query, params)
 
-        if len(result):
+        if result:
             return result[0]
 
         else:
@@ -271,11 +370,11 @@ class ModelDBService:
             ValueError: Passed kwarg not in Project schema
         """
 
-        # execute query
-        query = select(Project).filter_by(**kwargs)
-        result = self._model_db.select(query)
+        # execute query, a second row is only needed to detect duplicates
+        query, params = _select_query(Project, kwargs, limit=2)
+        result = self._model_db.select(query, params)
 
-        if len(result):
+        if result:
             if len(result) > 1:
                 # formatted this way to eventually move towards interpolated schema
                 logger.warning(
@@ -301,10 +400,11 @@ class ModelDBService:
             ValueError: Passed kwarg not in Project schema
         """
 
-        query = select(Flow).filter_by(**kwargs)
-        result = self._model_db.select(query)
+        # a second row is only needed to detect duplicates
+        query, params = _select_query(Flow, kwargs, limit=2)
+        result = self._model_db.select(query, params)
 
-        if len(result):
+        if result:
             if len(result) > 1:
                 # formatted this way to eventually move towards interpolated schema
                 logger.warning(
@@ -319,6 +419,18 @@ class ModelDBService:
         else:
             raise FlowNotFoundError(query)
 
+    def get_flows_by_ids(self, ids: List[str]) -> List[Flow]:
+        """Get a set of flows by flow id using a single query. Ids without a
+        matching flow are omitted, and rows are not returned in the order of ids.
+
+        Args:
+            ids (List[str]): Flow ids to select.
+
+        Returns:
+            List[Flow]
+        """
+        return self._select_by_ids(Flow, Flow.flow_id, ids)
+
     @validate_kwargs_exist(FlowOfFlows)
     def get_flow_of_flows(self, **kwargs) -> Flow:
         """Get a flow from criteria
@@ -330,16 +442,31 @@ class ModelDBService:
             ValueError: Passed kwarg not in Project schema
         """
 
-        query = select(FlowOfFlows).filter_by(**kwargs)
-        result = self._model_db.select(query)
+        # flow is many-to-one, so join it into the same query rather than lazy
+        # loading each child flow
+        query, params = _select_query(FlowOfFlows, kwargs, joined="flow")
+        result = self._model_db.select(query, params)
 
-        if len(result):
+        if result:
             return [res.flow for res in result]
 
         else:
             raise FlowOfFlowsNotFoundError(query)
 
-    def apply_schema(self) -> None:
-        """Applies database schema to connected service."""
+    def apply_schema(self, force: bool = False) -> None:
+        """Applies database schema to connected service. Schema is applied once per
+        engine url in a process, later calls are skipped unless forced.
+
+        Args:
+            force (bool): Apply schema even if already applied in this process, e.g.
+                after the database has been dropped and recreated.
+
+        """
+        key = self._model_db.engine.url.render_as_string(hide_password=True)
+
+        if key in _SCHEMA_APPLIED and not force:
+            logger.debug("Schema already applied to model db.")
+            return
 
         Base.metadata.create_all(self._model_db.engine)
+        _SCHEMA_APPLIED.add(key)
@@ -13,20 +13,20 @@ def validate_kwargs_exist(table, ignore: List[str] = []):
         ignore: List of kwargs to ignore
     """
 
+    # computed once at decoration time rather than on each call
+    allowed_kwargs = frozenset(
+        [col.key for col in table.__table__.columns] + list(ignore)
+    )
+
     def decorator(func):
         @wraps(func)
         def wrapper(*args, **kwargs):
 
-            allowed_kwargs = [col.key for col in table.__table__.columns]
-
-            unnecessary_kwargs = []
-
             # validate kwargs are members of the table
-            for kwarg in kwargs:
-                if kwarg not in allowed_kwargs and kwarg not in ignore:
-                    unnecessary_kwargs.append(kwarg)
-
-            if len(unnecessary_kwargs):
+            if not allowed_kwargs.issuperset(kwargs):
+                unnecessary_kwargs = [
+                    kwarg for kwarg in kwargs if kwarg not in allowed_kwargs
+                ]
                 raise ValueError(
                     f"Extra kwargs found in query for table {table.__tablename__}: \
                         {','.join(unnecessary_kwargs)}"
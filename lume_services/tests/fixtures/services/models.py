@@ -33,7 +33,7 @@ def mysql_service(mysql_config):
 
 
 @pytest.mark.usefixtures("docker_services")
-@pytest.fixture(scope="module", autouse=True)
+@pytest.fixture(scope="session", autouse=True)
 def model_db_service(mysql_service, mysql_database, base_mysql_uri):
 
     engine = create_engine(base_mysql_uri, pool_size=1)
@@ -41,7 +41,8 @@ def model_db_service(mysql_service, mysql_database, base_mysql_uri):
         connection.execute(f"CREATE DATABASE IF NOT EXISTS {mysql_database};")
 
     model_db_service = ModelDBService(mysql_service)
-    model_db_service.apply_schema()
+    # database is newly created, so apply schema regardless of earlier calls
+    model_db_service.apply_schema(force=True)
 
     # set up database
     yield model_db_service
@@ -142,6 +142,24 @@ class TestLumeSettings:
             == lume_services_settings.prefect.server.tag
         )
 
+    def test_configure_model_db_connection_from_env(
+        self, lume_services_settings, monkeypatch
+    ):
+        monkeypatch.setenv("LUME_MODEL_DB__CONNECTION__POOL_SIZE", "3")
+        monkeypatch.setenv("LUME_MODEL_DB__CONNECTION__MAX_OVERFLOW", "4")
+        monkeypatch.setenv("LUME_MODEL_DB__CONNECTION__POOL_RECYCLE", "60")
+
+        config.configure()
+
+        assert config._settings.model_db.connection.pool_size == 3
+        assert config._settings.model_db.connection.max_overflow == 4
+        assert config._settings.model_db.connection.pool_recycle == 60
+
+        pool = config.context.model_db().engine.pool
+        assert pool.size() == 3
+        assert pool._max_overflow == 4
+        assert pool._recycle == 60
+
     def test_configure_from_env_failure(self):
         mongodb_host = os.environ.pop("LUME_RESULTS_DB__HOST")
 
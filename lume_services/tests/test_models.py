@@ -1,9 +1,14 @@
 import pytest
 import logging
+from unittest.mock import patch
 from urllib.request import urlretrieve
+from sqlalchemy import insert
 from lume_services.environment.solver import Source
 
 from lume_services.environment.solver import _GITHUB_TARBALL_TEMPLATE
+from lume_services.errors import FlowOfFlowsNotFoundError
+from lume_services.services.models.db.schema import Base, FlowOfFlows
+from lume_services.services.models.service import _SCHEMA_APPLIED
 
 logger = logging.getLogger(__name__)
 
@@ -59,6 +64,22 @@ def test_download_from_file(url, tmp_path):
     Source(path=filepath)
 
 
+def test_apply_schema_once(model_db_service):
+    with patch.object(Base.metadata, "create_all") as create_all:
+        model_db_service.apply_schema()
+        create_all.assert_not_called()
+
+        model_db_service.apply_schema(force=True)
+        create_all.assert_called_once_with(model_db_service._model_db.engine)
+
+
+def test_apply_schema_key_hides_password(model_db_service):
+    password = model_db_service._model_db.config.password.get_secret_value()
+
+    assert _SCHEMA_APPLIED
+    assert all(password not in key for key in _SCHEMA_APPLIED)
+
+
 class TestModelDB:
 
     # model
@@ -67,11 +88,12 @@ class TestModelDB:
     facility = "lcls"
     beampath = "cu_hxr"
     description = "test_model"
+    second_description = "second_test_model"
 
     # deployment
     version = "v0.0"
     sha256 = "placeholder"
-    asset_dir = (None,)  # opt
+    asset_dir = None  # opt
     source = "my source"
     is_live = 1
     image = "placeholder"
@@ -83,6 +105,7 @@ class TestModelDB:
 
     # flow
     flow_id_placeholder = "test"
+    second_flow_id_placeholder = "second_test"
     flow_name = "my_test_flow"
 
     @pytest.fixture(scope="class")
@@ -149,6 +172,36 @@ class TestModelDB:
 
         assert model.model_id == model_id
 
+    @pytest.fixture(scope="class")
+    def second_model_id(self, model_db_service):
+        model_id = model_db_service.store_model(
+            author=self.author,
+            laboratory=self.laboratory,
+            facility=self.facility,
+            beampath=self.beampath,
+            description=self.second_description,
+        )
+        assert model_id is not None
+
+        return model_id
+
+    def test_get_models_by_ids(self, model_db_service, model_id, second_model_id):
+
+        models = model_db_service.get_models_by_ids([second_model_id, model_id])
+
+        assert sorted(model.model_id for model in models) == sorted(
+            [model_id, second_model_id]
+        )
+
+    def test_get_models_by_ids_empty(self, model_db_service):
+        assert model_db_service.get_models_by_ids([]) == []
+
+    def test_get_models_by_ids_unknown(self, model_db_service, model_id):
+        models = model_db_service.get_models_by_ids([model_id, -1])
+
+        assert [model.model_id for model in models] == [model_id]
+        assert model_db_service.get_models_by_ids([-1]) == []
+
     @pytest.fixture(scope="class")
     def deployment_id(self, model_db_service, model_id):
 
@@ -175,6 +228,72 @@ class TestModelDB:
 
         assert deployment.deployment_id == deployment_id
 
+    def test_get_deployment_multiple_keys(
+        self, model_db_service, model_id, deployment_id
+    ):
+        deployment = model_db_service.get_deployment(
+            model_id=model_id, version=self.version
+        )
+
+        assert deployment.deployment_id == deployment_id
+
+    def test_get_deployment_null_criterion(
+        self, model_db_service, model_id, deployment_id
+    ):
+        deployment = model_db_service.get_deployment(model_id=model_id, asset_dir=None)
+
+        assert deployment.deployment_id == deployment_id
+
+    def test_get_deployments_null_criterion(self, model_db_service, deployment_id):
+        deployments = model_db_service.get_deployments(asset_dir=None)
+
+        assert deployment_id in [deployment.deployment_id for deployment in deployments]
+
+    def test_get_deployments_bad_sig(self, model_db_service, model_id):
+        with pytest.raises(ValueError):
+            model_db_service.get_deployments(model_name=model_id)
+
+    @pytest.fixture(scope="class")
+    def second_deployment_id(self, model_db_service, second_model_id):
+
+        deployment_id = model_db_service.store_deployment(
+            model_id=second_model_id,
+            version=self.version,
+            asset_dir=self.asset_dir,
+            sha256=self.sha256,
+            source=self.source,
+            is_live=self.is_live,
+            image=self.image,
+            package_import_name=self.package_import_name,
+        )
+
+        assert deployment_id is not None
+
+        return deployment_id
+
+    def test_get_deployments_by_ids(
+        self, model_db_service, deployment_id, second_deployment_id
+    ):
+
+        deployments = model_db_service.get_deployments_by_ids(
+            [second_deployment_id, deployment_id]
+        )
+
+        assert sorted(deployment.deployment_id for deployment in deployments) == sorted(
+            [deployment_id, second_deployment_id]
+        )
+
+    def test_get_deployments_by_ids_empty(self, model_db_service):
+        assert model_db_service.get_deployments_by_ids([]) == []
+
+    def test_get_deployments_by_ids_unknown(self, model_db_service, deployment_id):
+        deployments = model_db_service.get_deployments_by_ids([deployment_id, -1])
+
+        assert [deployment.deployment_id for deployment in deployments] == [
+            deployment_id
+        ]
+        assert model_db_service.get_deployments_by_ids([-1]) == []
+
     @pytest.fixture(scope="class")
     def project_name(self, model_db_service):
         project_name = model_db_service.store_project(
@@ -262,3 +381,58 @@ class TestModelDB:
     def test_get_flow_bad_sig(self, model_db_service, flow_id):
         with pytest.raises(ValueError):
             model_db_service.get_flow(flow_identifier=flow_id)
+
+    @pytest.fixture(scope="class")
+    def second_flow_id(self, model_db_service, second_deployment_id, project_name):
+        flow_id = model_db_service.store_flow(
+            project_name=project_name,
+            deployment_id=second_deployment_id,
+            flow_id=self.second_flow_id_placeholder,
+            flow_name=self.flow_name,
+        )
+
+        assert flow_id is not None
+
+        return flow_id
+
+    def test_get_flows_by_ids(self, model_db_service, flow_id, second_flow_id):
+        flows = model_db_service.get_flows_by_ids([second_flow_id, flow_id])
+
+        assert sorted(flow.flow_id for flow in flows) == sorted(
+            [flow_id, second_flow_id]
+        )
+
+    def test_get_flows_by_ids_empty(self, model_db_service):
+        assert model_db_service.get_flows_by_ids([]) == []
+
+    def test_get_flows_by_ids_unknown(self, model_db_service, flow_id):
+        flows = model_db_service.get_flows_by_ids([flow_id, "unknown_flow"])
+
+        assert [flow.flow_id for flow in flows] == [flow_id]
+        assert model_db_service.get_flows_by_ids(["unknown_flow"]) == []
+
+    @pytest.fixture(scope="class")
+    def flow_of_flows_id(self, model_db_service, flow_id, second_flow_id):
+        # no service method stores flow of flows entries, insert directly
+        flow_of_flows_id = model_db_service._model_db.insert_scalar(
+            insert(FlowOfFlows).values(
+                parent_flow_id=flow_id, flow_id=second_flow_id, position=0
+            )
+        )
+
+        assert flow_of_flows_id is not None
+
+        return flow_of_flows_id
+
+    def test_get_flow_of_flows(
+        self, model_db_service, flow_id, second_flow_id, flow_of_flows_id
+    ):
+        flows = model_db_service.get_flow_of_flows(parent_flow_id=flow_id)
+
+        # session is closed on return, so child flows must already be loaded
+        assert [flow.flow_id for flow in flows] == [second_flow_id]
+        assert flows[0].flow_name == self.flow_name
+
+    def test_get_flow_of_flows_not_found(self, model_db_service, second_flow_id):
+        with pytest.raises(FlowOfFlowsNotFoundError):
+            model_db_service.get_flow_of_flows(parent_flow_id=second_flow_id)